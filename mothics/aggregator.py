@@ -27,7 +27,6 @@ Notes
 
 import glob
 import os
-import time
 import logging
 import threading
 from datetime import datetime, timedelta
@@ -70,6 +69,10 @@ class Aggregator:
         
         self.running = False
         """Aggregator loop status"""
+        self._stop_event = threading.Event()
+        """Set by `stop()` to wake the loop without waiting a full interval"""
+        self._lock = threading.Lock()
+        """Serializes raw data fetches across `aggregate()` callers"""
         # Raw data management
         self.raw_data = raw_data
         """Dictionary containing raw data to be aggregated"""
@@ -77,6 +80,8 @@ class Aggregator:
         """External getter function to fetch a raw data dictionary"""
         self.last_comm_time = {}
         """Last timestamp from all managed topics"""
+        self._last_ts_keys = {}
+        """Cache of `<remote>/last_timestamp` keys, by topic"""
         # Handle raw_data
         if self.raw_data is None and self.get_raw_data is None:
             self.logger.critical(f'no raw data nor getter available, got {raw_data=}, {raw_data_getter=}')
@@ -116,8 +121,6 @@ class Aggregator:
             
             # Get data with thread lock to ensure no reading operation
             # is tampered with by outside processes
-            self._lock = threading.Lock()
-
             if self.get_raw_data is not None:
                 with self._lock:
                     self.raw_data = self.get_raw_data()
@@ -126,16 +129,19 @@ class Aggregator:
             flat_data = {}
             for topic, value in self.raw_data.items():
                 # Get topic for timestamp
-                last_timestamp_id = topic.split('/')[0] + '/last_timestamp'
+                last_timestamp_id = self._last_ts_keys.get(topic)
+                if last_timestamp_id is None:
+                    last_timestamp_id = self._last_ts_keys[topic] = topic.partition('/')[0] + '/last_timestamp'
                 try:
-                    flat_data[topic] = list(value[-1].values())[0]
+                    # Each sample is a single {timestamp: value} entry
+                    (last_ts, flat_data[topic]), = value[-1].items()
                     
                     # Get timestamp from raw_data for each topic
                     # NOTE: for simplicity, this just overwrites the
                     # last fetched timestamp, not caring about
                     # differences in timestamps from different sensors
                     # in the same unit
-                    flat_data[last_timestamp_id] = list(value[-1].keys())[0]
+                    flat_data[last_timestamp_id] = last_ts
                 except IndexError:
                     flat_data[topic] = None
                     flat_data[last_timestamp_id] = None
@@ -157,6 +163,7 @@ class Aggregator:
         """
         if not self.running:
             self.running = True
+            self._stop_event.clear()
             self.thread = threading.Thread(target=self._run_loop, daemon=True, name='Aggregator loop')
             self.thread.start()
             self.logger.info("started non-blocking loop.")
@@ -165,12 +172,12 @@ class Aggregator:
         """
         Internal loop for the aggregator.
 
-        This loop continuously calls `aggregate()` then sleeps for `self.interval`
+        This loop continuously calls `aggregate()` then waits for `self.interval`
         seconds. It remains active while `running` is True.
         """
         while self.running:
             self.aggregate()
-            time.sleep(self.interval)            
+            self._stop_event.wait(self.interval)            
 
     def stop(self):
         """
@@ -181,6 +188,7 @@ class Aggregator:
         collection until `start()` is called again.
         """
         self.running = False
+        self._stop_event.set()
         if self.thread and self.thread.is_alive():
             self.thread.join()
         self.logger.info("stopped loop.")
@@ -1,8 +1,15 @@
+import os
+import time
 from flask import Blueprint, render_template, jsonify, request, Response, current_app
 
 
 log_bp = Blueprint('log', __name__)
 
+_LOG_POLL_INTERVAL = 0.5
+"""Seconds to wait for new log lines once the end of the file is reached"""
+_LOG_KEEPALIVE = 15
+"""Seconds of silence before a keep-alive comment is sent to the client"""
+
 
 @log_bp.route('/logs')
 def logs():
@@ -13,10 +20,23 @@ def stream_logs():
     logger_fname = current_app.config['LOGGER_FNAME']
     def generate():
         with open(logger_fname, 'r') as f:
+            idle = 0
             while True:
                 line = f.readline()
                 if line:
+                    idle = 0
                     yield f"data: {line}\n\n"
+                    continue
+                # At end of file: sleep instead of spinning on readline
+                time.sleep(_LOG_POLL_INTERVAL)
+                idle += _LOG_POLL_INTERVAL
+                # Start over if the log file was emptied
+                if os.fstat(f.fileno()).st_size < f.tell():
+                    f.seek(0)
+                # Periodic comment, so closed connections are noticed
+                if idle >= _LOG_KEEPALIVE:
+                    idle = 0
+                    yield ": keep-alive\n\n"
     return Response(generate(), content_type='text/event-stream')
 
 @log_bp.route('/empty_log_file', methods=['POST'])
@@ -1,7 +1,9 @@
 import os
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from operator import attrgetter
 from flask import Blueprint, render_template, jsonify, request, Response, current_app, abort, send_file
-from ..helpers import compute_status, get_tile_zoom_levels
+from ..helpers import parse_timestamp, get_tile_zoom_levels, lttb_indices
 
 monitor_bp = Blueprint('monitor', __name__)
 
@@ -12,18 +14,32 @@ def index():
     return render_template("index.html", auto_refresh=auto_refresh)
 
 
+_table_cache = (None, '')
+"""Last rendered data table, keyed on the data point it was rendered from"""
+
+
 @monitor_bp.route("/api/get_table")
 def get_table():
+    global _table_cache
     database = current_app.config['GETTERS']['database']()
     data_points = database.data_points
 
     if not data_points:
         return render_template("table.html", table_data=[])
 
-    latest_row = data_points[-1].to_dict()
-    hidden = set(current_app.config.get('HIDDEN_DATA_CARDS') or [])
+    latest_dp = data_points[-1]
+    latest_row = latest_dp.input_data
+    hidden_cards = current_app.config.get('HIDDEN_DATA_CARDS')
     data_thesaurus = current_app.config.get('DATA_THESAURUS', {})
 
+    # The table only changes with a new data point: polls within a tick
+    # get the previous render
+    cache_key = (id(latest_dp), latest_dp.timestamp, id(hidden_cards), id(data_thesaurus))
+    cached_key, html = _table_cache
+    if cached_key == cache_key:
+        return html
+    hidden = set(hidden_cards or [])
+
     # Extract all sample rates into a dictionary keyed by their base path.                
     # This makes it easy to associate a sample rate with its corresponding metric.    
     sample_rates = {}
@@ -48,27 +64,87 @@ def get_table():
         if base in sample_rates:
             filtered_row[alias]['sample_rate'] = sample_rates[base]
 
-    # Include a global timestamp (for "Last Sampled") if available
-    if 'timestamp' in latest_row:
-        filtered_row['timestamp'] = latest_row['timestamp']
+    # Include a global timestamp (for "Last Sampled")
+    filtered_row['timestamp'] = latest_dp.iso_timestamp
 
     # The template expects table_data as a list of rows
-    return render_template("table.html", table_data=[filtered_row])
+    html = render_template("table.html", table_data=[filtered_row])
+    _table_cache = (cache_key, html)
+    return html
+
+
+_status_cache = (None, {})
+"""Last computed remote unit status, keyed on the data point it was computed from"""
+_status_keys = (frozenset(), None, ())
+"""Field set and thesaurus of the last status computation, with its `(last_timestamp key, name)` pairs"""
+
+
+def _last_timestamp_keys(input_data, rm_thesaurus=None):
+    """
+    `(key, name)` pairs of the `<remote>/last_timestamp` fields in `input_data`.
+
+    `name` is the remote unit name, translated through `rm_thesaurus` if
+    given. The aggregator emits the same fields on every tick, so the
+    pairs are only rebuilt when the field set (or thesaurus) changes.
+    """
+    global _status_keys
+    fields, thesaurus, pairs = _status_keys
+    if input_data.keys() != fields or rm_thesaurus is not thesaurus:
+        names = rm_thesaurus or {}
+        pairs = []
+        for k in input_data:
+            if 'last_timestamp' in k:
+                rm = k.partition('/')[0]
+                pairs.append((k, names.get(rm, rm)))
+        _status_keys = (frozenset(input_data), rm_thesaurus, tuple(pairs))
+    return _status_keys[2]
+
+
+def _remote_status(dp, timeout_noncomm, timeout_offline, rm_thesaurus=None):
+    """
+    Status of each remote unit for data point `dp`, by (translated) name.
+
+    The status only changes when the aggregator appends a new point, so
+    auto-refreshing clients polling within the same tick reuse the
+    previous result instead of rescanning every topic.
+    """
+    global _status_cache
+    key = (id(dp), dp.timestamp, timeout_noncomm, timeout_offline, id(rm_thesaurus))
+    cached_key, status_data = _status_cache
+    if cached_key == key:
+        return status_data
+
+    # Thresholds are shifted once, then each unit costs two comparisons
+    now = dp.timestamp
+    offline_cut = now - timedelta(seconds=timeout_offline)
+    noncomm_cut = now - timedelta(seconds=timeout_noncomm)
+    status_data = {}
+    for field, rm in _last_timestamp_keys(dp.input_data, rm_thesaurus):
+        ts = dp.input_data[field]
+        if isinstance(ts, str):
+            ts = parse_timestamp(ts)
+        if ts is None or ts < offline_cut:
+            status = 'offline'
+        elif ts < noncomm_cut:
+            status = 'noncomm'
+        else:
+            status = 'online'
+        status_data[rm] = status
+    _status_cache = (key, status_data)
+    return status_data
 
 
 @monitor_bp.route("/api/get_status")
 def get_status():
     database = current_app.config['GETTERS']['database']()
-    latest_data = database.data_points[-1].to_dict() if database.data_points else {}
-    now = latest_data['timestamp']
+    if not database.data_points:
+        return render_template("status.html", status_data={})
     
-    # Compute status for each remote unit
-    status_data = {rm.split('/')[0]: compute_status(ts, now=now, timeout_noncomm=current_app.config.get('TIMEOUT_NONCOMM', 30), timeout_offline=current_app.config.get('TIMEOUT_OFFLINE', 60)) for rm, ts in latest_data.items() if 'last_timestamp' in rm}
-
-    # Apply remote unit thesaurus if available
-    rm_thesaurus = current_app.config['RM_THESAURUS']
-    if rm_thesaurus:
-        status_data = {rm_thesaurus.get(rm, rm): status for rm, status in status_data.items()}
+    # Compute status for each remote unit, named through the thesaurus if available
+    status_data = _remote_status(database.data_points[-1],
+                                 current_app.config.get('TIMEOUT_NONCOMM', 30),
+                                 current_app.config.get('TIMEOUT_OFFLINE', 60),
+                                 current_app.config['RM_THESAURUS'])
     return render_template("status.html", status_data=status_data)
 
 
@@ -89,7 +165,7 @@ def gps_map():
 @monitor_bp.route("/api/gps_info")
 def gps_info():
     db = current_app.config['GETTERS']['database']()
-    latest = db.data_points[-1].to_dict() if db.data_points else {}
+    latest = db.data_points[-1].input_data if db.data_points else {}
 
     lat_key = next((k for k in latest if k.endswith("/gps/lat")), None)
     lon_key = next((k for k in latest if k.endswith("/gps/long")), None)
@@ -135,22 +211,22 @@ def gps_track():
     window_minutes = current_app.config.get("GPS_HISTORY_MINUTES", 10)
     cutoff = datetime.utcnow() - timedelta(minutes=window_minutes)
 
-    # Filter all data points newer than the cutoff timestamp
-    datapoints = [
-        dp for dp in db.data_points
-        if "timestamp" in dp.to_dict() and
-        datetime.fromisoformat(dp.to_dict()["timestamp"]) >= cutoff
-    ]
+    # Data points are in time order: skip straight to the ones after the cutoff
+    points = db.data_points
+    datapoints = points[bisect_left(points, cutoff, key=attrgetter('timestamp')):]
     
     track_data = []
 
     track_key = current_app.config.get("TRACK_VARIABLE", "speed")
+    lat_key = lon_key = value_key = None
     for dp in datapoints:
-        d = dp.to_dict()
+        d = dp.input_data
 
-        lat_key = next((k for k in d if k.endswith("/gps/lat")), None)
-        lon_key = next((k for k in d if k.endswith("/gps/long")), None)
-        value_key = next((k for k in d if track_key in k and "/gps/" in k), None)
+        # Field names rarely change, so look the keys up again only when they do
+        if lat_key not in d or lon_key not in d or value_key not in d:
+            lat_key = next((k for k in d if k.endswith("/gps/lat")), None)
+            lon_key = next((k for k in d if k.endswith("/gps/long")), None)
+            value_key = next((k for k in d if track_key in k and "/gps/" in k), None)
 
         if lat_key and lon_key:
             lat = d[lat_key]
@@ -161,42 +237,87 @@ def gps_track():
                 "lat": lat,
                 "lon": lon,
                 "value": val,
-                "timestamp": d.get("timestamp")
+                "timestamp": dp.iso_timestamp
             })
 
     return jsonify({"track": track_data})
 
+def _as_float(raw):
+    """Plot value of `raw`, or None if it is missing or not numeric."""
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+_plot_cache = (None, {})
+"""Encoded plot payloads for the newest data point, by request variant"""
+
+
 @monitor_bp.route("/api/track_plot_data")
 def track_plot_data():
+    global _plot_cache
     track = current_app.config['GETTERS']['database']()
     if not track:
         return jsonify({"error": "No track loaded"}), 400
 
     # ——— gather points & all distinct variable names ———
     points      = list(track.data_points)
-    all_keys    = {k for p in points for k in p.input_data.keys()}
     hidden      = set(current_app.config.get("HIDDEN_DATA_PLOTS", []))
     thesaurus   = current_app.config.get("DATA_THESAURUS", {})
+
+    # ——— every client polling within a tick shares one encoded payload ———
+    tick    = (id(track), len(points), id(points[-1]) if points else None)
+    variant = (request.args.get("vars", ""), request.args.get("since"), request.args.get("max_points"),
+               frozenset(hidden), tuple(thesaurus.items()))
+    cached_tick, payloads = _plot_cache
+    if cached_tick != tick:
+        payloads = {}
+        _plot_cache = (tick, payloads)
+    body = payloads.get(variant)
+    if body is not None:
+        return Response(body, mimetype="application/json")
+
+    # ——— only the points after `since`, if the client already holds the rest ———
+    # NOTE: a `since` outside the track (e.g. after switching tracks), or
+    # one that cannot be compared with it (aware vs naive timestamps),
+    # gets the full series, which the client takes as a reset
+    try:
+        since = datetime.fromisoformat(request.args["since"])
+    except (KeyError, ValueError):
+        since = None
+    if since is not None and points and (since.tzinfo is None) != (points[0].timestamp.tzinfo is None):
+        since = None
+    delta = bool(points) and since is not None and points[0].timestamp <= since <= points[-1].timestamp
+    start = points[0].iso_timestamp if points else None
+    if delta:
+        points = points[bisect_right(points, since, key=attrgetter('timestamp')):]
+
+    all_keys    = set().union(*(p.input_data.keys() for p in points))
     filter_set  = set(request.args.get("vars", "").split(",")) if request.args.get("vars") else None
 
-    # ——— build zero-filled (or None-filled) matrix up front ———
+    # ——— one column per selected variable, None where missing ———
+    # NOTE: built column by column, so unselected variables cost nothing
     vars_by_name = {
-        k: [None] * len(points)      # placeholder for every timestamp
+        k: [_as_float(p.input_data.get(k)) for p in points]
         for k in all_keys
         if (filter_set is None or k in filter_set) and k not in hidden
     }
 
-    # ——— fill in the slots we actually have ———
-    for idx, dp in enumerate(points):
-        for k, raw in dp.input_data.items():
-            if k in vars_by_name:
-                try:
-                    vars_by_name[k][idx] = float(raw)
-                except (ValueError, TypeError):
-                    pass  # leave None in place
-
-    return jsonify(
-        timestamps=[p.timestamp.isoformat() for p in points],
+    # ——— optionally downsample full series, keeping each variable's shape ———
+    max_points = request.args.get("max_points", type=int)
+    if max_points and vars_by_name and not delta and len(points) > max_points:
+        x = [p.timestamp.timestamp() for p in points]
+        keep = sorted(set().union(*(lttb_indices(x, col, max_points) for col in vars_by_name.values())))
+        points = [points[i] for i in keep]
+        vars_by_name = {k: [col[i] for i in keep] for k, col in vars_by_name.items()}
+
+    body = jsonify(
+        timestamps=[p.iso_timestamp for p in points],
         vars=vars_by_name,
-        aliases={k: thesaurus.get(k, k) for k in vars_by_name}
-    )
+        aliases={k: thesaurus.get(k, k) for k in vars_by_name},
+        delta=delta,
+        start=start
+    ).get_data()
+    payloads[variant] = body
+    return Response(body, mimetype="application/json")
@@ -38,11 +38,26 @@ from smbus2 import SMBus
 from datetime import datetime, timedelta
 import paho.mqtt.client as mqtt
 from paho.mqtt import MQTTException
-from .helpers import setup_logger, tipify
+from .helpers import setup_logger, tipify_bytes
 from .gpio_modules import MODULE_REGISTRY
 from .i2c_modules import *
 import adafruit_bno055
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON codec for interface messages; both encoders return UTF-8 bytes
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 
 # Interface
 
@@ -166,16 +181,14 @@ class SerialBaseInterface(BaseInterface):
 
         This method appends a dict containing the current timestamp
         and the received data to `raw_data[topic]`. If the topic did not
-        previously exist, a new entry is created.
+        previously exist, a new entry is created; existing entries are
+        never reset.
 
         Args:
             topic (str): The topic under which data was received.
             data (Any): The decoded data for that topic.
         """
-        if topic not in self.topics:
-            self.raw_data[topic] = []
-        timestamp = datetime.now()
-        self.raw_data[topic].append({timestamp: data})
+        self.raw_data.setdefault(topic, []).append({datetime.now(): data})
 
     def connect(self):
         pass
@@ -286,14 +299,14 @@ class JSONInterface(SerialBaseInterface):
             try:
                 line = self.serial_conn.readline().decode('utf-8').strip()
                 if line:
-                    self.logger.debug(f"received: {line}")
+                    self.logger.debug("received: %s", line)
                     try:
                         for json_obj in line.split("}{"):  # Handles multiple JSON objects
                             if not json_obj.startswith("{"):
                                 json_obj = "{" + json_obj
                             if not json_obj.endswith("}"):
                                 json_obj = json_obj + "}"
-                            message = json.loads(json_obj)
+                            message = _json_loads(json_obj)
                             for topic, value in message.items():
                                 self.on_message_callback(topic, value)
                     except json.JSONDecodeError as e:
@@ -335,9 +348,9 @@ class JSONInterface(SerialBaseInterface):
             self.logger.critical("attempted to publish without an open connection.")
             raise RuntimeError("serial connection is not open.")
 
-        message = json.dumps({"topic": topic, "payload": payload})
-        self.serial_conn.write(message.encode('utf-8'))
-        self.logger.info(f"published to serial: {message}")
+        message = _json_dumps({"topic": topic, "payload": payload})
+        self.serial_conn.write(message)
+        self.logger.info("published to serial: %s", message.decode())
 
 
 class GPSInterface(SerialBaseInterface):
@@ -359,7 +372,7 @@ class GPSInterface(SerialBaseInterface):
                 if not line:
                     continue
 
-                self.logger.debug(f"received NMEA: {line}")
+                self.logger.debug("received NMEA: %s", line)
 
                 # Solo stringhe NMEA
                 if not line.startswith("$"):
@@ -477,7 +490,7 @@ class BNO055Interface(SerialBaseInterface):
 
             except Exception as e:
                 if "error: 7" in str(e):
-                    self.logger.debug(f"error reading BNO055 data: {e}")
+                    self.logger.debug("error reading BNO055 data: %s", e)
                 else:
                     self.logger.warning(f"error reading BNO055 data: {e}")
 
@@ -611,18 +624,20 @@ class MQTTInterface(BaseInterface):
         """
         Callback triggered when an MQTT message is received.
 
-        Decodes payload to a string, then attempts to convert it into
-        typed data (`tipify` helper). The result is handed off to
-        `on_message_callback`.
+        Converts the raw payload into typed data (`tipify_bytes` helper),
+        decoding it to a string only if it is not numeric. The result is
+        handed off to `on_message_callback`.
 
         Args:
             client (mqtt.Client): The MQTT client instance for this callback.
             userdata (Any): User-defined data passed to the client object.
             msg (mqtt.MQTTMessage): The received MQTT message.
         """
-        self.logger.debug(f"message received on {msg.topic}: {msg.payload.decode()}")
         try:
-            data = tipify(msg.payload.decode())
+            data = tipify_bytes(msg.payload)
+            # NOTE: lazy %-formatting, so the message is only built when
+            # debug logging is actually enabled
+            self.logger.debug("message received on %s: %s", msg.topic, data)
             # Pass topic and data to the external handler
             self.on_message_callback(msg.topic, data)
         except ValueError:
@@ -671,16 +686,14 @@ class MQTTInterface(BaseInterface):
 
         This method appends a dict containing the current timestamp
         and the received data to `raw_data[topic]`. If the topic did not
-        previously exist in the dictionary, it is created.
+        previously exist in the dictionary, it is created; existing entries
+        are never reset.
 
         Args:
             topic (str): The topic under which data was received.
             data (Any): The typed or raw data payload.
         """
-        if topic not in self.topics:
-            self.raw_data[topic] = []
-        timestamp = datetime.now()
-        self.raw_data[topic].append({timestamp: data})
+        self.raw_data.setdefault(topic, []).append({datetime.now(): data})
 
     def publish(self, topic, payload):
         """
@@ -693,13 +706,13 @@ class MQTTInterface(BaseInterface):
         Raises:
             RuntimeError: If `topic` is not in the subscribed topics list.
         """
-        message = json.dumps(payload)
+        message = _json_dumps(payload)
         if topic in self.topics:
             self.client.publish(topic, message)
         else:
             self.logger.critical(f'{topic} is not in topics list: {self.topics}')
             raise RuntimeError(f'{topic} is not in topics list: {self.topics}')
-        self.logger.info(f"published to {topic}: {message}")
+        self.logger.info("published to %s: %s", topic, message.decode())
 
 
 class GPIOInterface(BaseInterface):
@@ -1118,14 +1131,15 @@ class Communicator:
             topic (str): The topic string.
 
         Returns:
-            list[str]: A list of components (module, sensor, quantity).
+            tuple[str]: The components (module, sensor, quantity).
 
         Raises:
             AssertionError: If the topic does not have exactly 3 sections.
         """
-        topic_split = topic.split("/")
-        assert len(topic_split) == 3, f"topic is malformed, got {topic_split}"
-        return topic_split
+        module, sep, rest = topic.partition("/")
+        sensor, sep2, quantity = rest.partition("/")
+        assert sep and sep2 and "/" not in quantity, f"topic is malformed, got {topic}"
+        return module, sensor, quantity
 
     @property
     def raw_data(self):
@@ -1146,12 +1160,14 @@ class Communicator:
         
         # Merge data from all interfaces
         for interface in self.interfaces.values():
-            for topic, data_list in interface.raw_data.items():
+            for topic, data_list in list(interface.raw_data.items()):
                 # Ensure each interface does not exceed max values to avoid memory leaks
                 if len(data_list) > self.max_values:
                     trim_count = int(len(data_list) * self.trim_fraction)
-                    interface.raw_data[topic] = data_list[trim_count:]  # Trim oldest data
-                    self.logger.debug(f"trimmed {trim_count} entries from {topic} in {interface.__class__.__name__}")
+                    # Trim oldest data in place, so samples appended meanwhile
+                    # by the interface thread are not lost with a stale list
+                    del data_list[:trim_count]
+                    self.logger.debug("trimmed %d entries from %s in %s", trim_count, topic, interface.__class__.__name__)
                 
                 if topic not in merged_data:
                     merged_data[topic] = []
@@ -1165,7 +1181,7 @@ class Communicator:
 
         # Sort data by timestamp for each topic
         for topic in merged_data:
-            merged_data[topic].sort(key=lambda x: list(x.keys())[0])
+            merged_data[topic].sort(key=lambda x: next(iter(x)))
 
         return merged_data        
     
@@ -576,7 +576,8 @@ class MothicsCLI(Cmd):
                 (lat_min, lat_max),
                 (lon_min, lon_max),
                 zoom_levels,
-                output_dir=output_path
+                output_dir=output_path,
+                tiles=tiles_needed
             )
 
             self.print("Tile download complete.", level='success')
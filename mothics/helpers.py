@@ -1,5 +1,7 @@
 import platform
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import math
 import sys
@@ -7,6 +9,27 @@ import logging
 from datetime import datetime, timedelta
 import dateutil.parser as parser 
 import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Shared HTTP session: keeps connections alive across CDN, tile and
+# connectivity requests instead of paying a TCP+TLS handshake per request.
+# Connection errors are not retried, so offline probes still fail fast;
+# throttling (429) is not retried either, to back off from the server.
+HTTP = requests.Session()
+HTTP.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                   max_retries=Retry(total=3, connect=0, backoff_factor=0.3,
+                                                     status_forcelist=(500, 502, 503, 504))))
+
+_PROBE_ADAPTER = HTTPAdapter(max_retries=Retry(total=0, connect=0, read=0))
+"""Adapter of connectivity probes: a single attempt, bounded by the probe timeout"""
 
 
 def tipify(s):
@@ -31,13 +54,36 @@ def tipify(s):
     """
     if '_' in s:
         return s
+    # int() never accepts a dot or an exponent, so skip the failed attempt
+    if '.' not in s and 'e' not in s and 'E' not in s:
+        try:
+            return int(s)
+        except ValueError:
+            pass
     try:
-        return int(s)
+        return float(s)
     except ValueError:
+        return s
+
+
+def tipify_bytes(b):
+    """
+    Convert a bytes payload (e.g. an MQTT message) into the best matching type.
+
+    Same rules as `tipify`, but numbers are parsed straight from the
+    bytes; only non-numeric payloads are decoded to `str`.
+    """
+    if b'_' not in b:
+        if b'.' not in b and b'e' not in b and b'E' not in b:
+            try:
+                return int(b)
+            except ValueError:
+                pass
         try:
-            return float(s)
+            return float(b)
         except ValueError:
-            return s
+            pass
+    return b.decode()
 
     
 def setup_logger(name, level=logging.INFO, fname=None, silent=False):
@@ -66,6 +112,17 @@ def setup_logger(name, level=logging.INFO, fname=None, silent=False):
     logger.addHandler(ch)
 
 
+def parse_timestamp(timestamp):
+    """
+    Parse a timestamp string, trying the ISO format written by `Track`
+    before falling back to the (much slower) generic parser.
+    """
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return parser.parse(timestamp)
+
+
 def compute_status(timestamp, now=None, timeout_offline=60, timeout_noncomm=30):
     """
     Compute status of a remote unit by checking timestamp against current time.
@@ -77,9 +134,9 @@ def compute_status(timestamp, now=None, timeout_offline=60, timeout_noncomm=30):
     
     # Convert timestamp to datetime object
     if isinstance(timestamp, str):
-        timestamp = parser.parse(timestamp)
+        timestamp = parse_timestamp(timestamp)
     if isinstance(now, str):
-        now = parser.parse(now)
+        now = parse_timestamp(now)
     
     # Compare timestamps
     if timestamp is None or now - timedelta(seconds=timeout_offline) > timestamp:
@@ -89,6 +146,50 @@ def compute_status(timestamp, now=None, timeout_offline=60, timeout_noncomm=30):
     else:
         return "online"
 
+def lttb_indices(x, y, n_out):
+    """
+    Select the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Points where `y` is None are skipped. The first and last valid points
+    are always kept; in between, one point is picked per bucket so that the
+    shape of the series is preserved.
+
+    Args:
+        x (list[float]): Monotonic x coordinates (e.g. epoch seconds).
+        y (list[float]): Values, possibly with None gaps.
+        n_out (int): Maximum number of points to keep.
+
+    Returns:
+        list[int]: Sorted indices into `x`/`y` of the points to keep.
+    """
+    valid = [i for i, v in enumerate(y) if v is not None]
+    n = len(valid)
+    if n <= n_out or n_out < 3:
+        return valid
+
+    kept = [valid[0]]
+    every = (n - 2) / (n_out - 2)
+    a = valid[0]
+    for b in range(n_out - 2):
+        start = int(b * every) + 1
+        end = int((b + 1) * every) + 1
+        # Average of the next bucket (the last point, for the last bucket)
+        nxt = valid[end:min(int((b + 2) * every) + 1, n)]
+        avg_x = sum(x[i] for i in nxt) / len(nxt)
+        avg_y = sum(y[i] for i in nxt) / len(nxt)
+
+        # Keep the point forming the largest triangle with `a` and the average
+        ax, ay = x[a], y[a]
+        best, best_area = valid[start], -1.0
+        for i in valid[start:end]:
+            area = abs((ax - avg_x) * (y[i] - ay) - (ax - x[i]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+        a = best
+    kept.append(valid[-1])
+    return kept
+
 def format_duration(seconds):
     """
     Convert seconds into a string in the format "Hh Mm Ss".
@@ -103,12 +204,12 @@ def format_duration(seconds):
     except (ValueError, TypeError):
         return "N/A"
 
-def download_file(url, dest_path):
+def download_file(url, dest_path, session=HTTP):
     """Download a file from the URL if it doesn't already exist."""
     if os.path.exists(dest_path):
         return
 
-    response = requests.get(url)
+    response = session.get(url)
     response.raise_for_status()  # Raise an error for bad status codes
 
     # Create the destination directory if it doesn't exist
@@ -117,19 +218,35 @@ def download_file(url, dest_path):
     with open(dest_path, 'wb') as f:
         f.write(response.content)
     
-def download_cdn(urls=None, outdir='static'):
+def download_cdn(urls=None, outdir='static', max_workers=8, session=HTTP):
+    """
+    Download CDN files to `outdir`, fetching them concurrently.
+
+    CDN fetches are dominated by connection latency, so files are
+    downloaded in a thread pool of up to `max_workers` threads.
+    """
     if urls is None:
         urls = [
             "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css",
             "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"
         ]
-    
+
+    # Map each destination path to its URL; duplicated URLs would
+    # otherwise be written concurrently to the same file
+    jobs = {}
     for url in urls:
         # Extract the filename from the URL
         filename = os.path.basename(url)
         # Generate the destination path
-        dest = os.path.join(outdir, filename)
-        download_file(url, dest)
+        jobs.setdefault(os.path.join(outdir, filename), url)
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [executor.submit(download_file, url, dest, session) for dest, url in jobs.items()]
+        # Propagate the first download error, as the sequential version did
+        for future in futures:
+            future.result()
 
 
 def check_cdn_availability(urls=None, outdir='static'):
@@ -152,19 +269,64 @@ def check_cdn_availability(urls=None, outdir='static'):
     
     return missing_files
 
-def check_internet_connectivity(test_url="https://www.google.com", timeout=5):
+def precompress_static(static_dir='static', extensions=('.js', '.css', '.svg', '.json', '.html'), min_size=1024):
+    """
+    Write `.gz` (and `.br`, if `brotli` is installed) siblings of static assets.
+
+    The web app serves these instead of compressing the same files on
+    every request. Only top-level files in `static_dir` are processed;
+    siblings newer than their source are left untouched.
+
+    Args:
+        static_dir (str): Directory containing the static assets.
+        extensions (tuple[str]): Extensions of compressible files.
+        min_size (int): Files smaller than this (in bytes) are skipped.
+    """
+    encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+
+    with os.scandir(static_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(extensions):
+                continue
+            src_stat = entry.stat()
+            if src_stat.st_size < min_size:
+                continue
+            data = None
+            for suffix, encode in encoders:
+                dest = entry.path + suffix
+                try:
+                    if os.stat(dest).st_mtime >= src_stat.st_mtime:
+                        continue
+                except FileNotFoundError:
+                    pass
+                if data is None:
+                    with open(entry.path, 'rb') as f:
+                        data = f.read()
+                # Replace atomically, the file may be served concurrently
+                tmp = dest + '.tmp'
+                with open(tmp, 'wb') as f:
+                    f.write(encode(data))
+                os.replace(tmp, dest)
+
+def check_internet_connectivity(test_url="https://www.google.com", timeout=5, session=HTTP):
     """
     Checks for an active internet connection by sending a HEAD request to a well-known website.
     
     Args:
         test_url (str): The URL to test connectivity.
         timeout (int): The timeout for the request in seconds.
+        session (requests.Session): Session used to send the request.
         
     Returns:
         bool: True if the internet is available, False otherwise.
     """
+    # Probe without retries, so a blackholed network costs one timeout
+    if session.get_adapter(test_url) is not _PROBE_ADAPTER:
+        session.mount(test_url, _PROBE_ADAPTER)
     try:
-        response = requests.head(test_url, timeout=timeout)
+        response = session.head(test_url, timeout=timeout)
         return response.status_code == 200
     except requests.RequestException as e:
         return False
@@ -177,7 +339,18 @@ def deg2num(lat_deg, lon_deg, zoom):
     ytile = int((1.0 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2.0 * n)
     return xtile, ytile
 
-def download_tiles(lat_range, lon_range, zoom_levels, output_dir="static/tiles", timeout=5):
+def _download_tile(url, tile_path, headers, timeout, session=HTTP):
+    """Fetch a single map tile and store it at `tile_path`."""
+    try:
+        response = session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 200:
+            with open(tile_path, 'wb') as f:
+                f.write(response.content)
+    except Exception as e:
+        logging.getLogger("Tiles").warning("error downloading %s: %s", url, e)
+
+
+def download_tiles(lat_range, lon_range, zoom_levels, output_dir="static/tiles", timeout=5, max_workers=2, tiles=None, session=HTTP):
     """
     Downloads and stores OpenStreetMap tiles for a specified geographic
     bounding box and zoom levels.
@@ -191,6 +364,12 @@ def download_tiles(lat_range, lon_range, zoom_levels, output_dir="static/tiles",
     download tiles for (e.g., range(12, 16)).
         output_dir (str): Path to the local directory where tiles should
     be stored, following the convention {z}/{x}/{y}.png.
+        max_workers (int): Maximum number of tiles fetched concurrently.
+    Defaults to 2, the limit set by the OSM tile usage policy.
+        tiles (list, optional): Precomputed (z, x, y) tiles, as returned
+    by `list_required_tiles`. If None, tiles are computed from the
+    bounding box and zoom levels.
+        session (requests.Session): Session used to fetch the tiles.
 
     Overly large bounding boxes or zoom levels may result in high
     numbers of downloads and can be rate-limited by OSM.
@@ -200,25 +379,25 @@ def download_tiles(lat_range, lon_range, zoom_levels, output_dir="static/tiles",
     headers = {
         "User-Agent": "MothicsTileFetcher/1.0"
     }
-    
-    for zoom in zoom_levels:
-        x_start, y_start = deg2num(lat_range[1], lon_range[0], zoom)
-        x_end, y_end = deg2num(lat_range[0], lon_range[1], zoom)
 
-        for x in range(x_start, x_end + 1):
-            for y in range(y_start, y_end + 1):
-                url = f"https://tile.openstreetmap.org/{zoom}/{x}/{y}.png"
-                tile_path = os.path.join(output_dir, f"{zoom}/{x}/{y}.png")
-
-                if not os.path.exists(tile_path):
-                    os.makedirs(os.path.dirname(tile_path), exist_ok=True)
-                    try:
-                        response = requests.get(url, timeout=timeout, headers=headers)
-                        if response.status_code == 200:
-                            with open(tile_path, 'wb') as f:
-                                f.write(response.content)
-                    except Exception as e:
-                        print(f"Error downloading {url}: {e}")
+    if tiles is None:
+        tiles = list_required_tiles(lat_range, lon_range, zoom_levels)
+
+    # Collect missing tiles first, then fetch them concurrently
+    jobs = []
+    for zoom, x, y in tiles:
+        url = f"https://tile.openstreetmap.org/{zoom}/{x}/{y}.png"
+        tile_path = os.path.join(output_dir, f"{zoom}/{x}/{y}.png")
+
+        if not os.path.exists(tile_path):
+            os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+            jobs.append((url, tile_path))
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        for url, tile_path in jobs:
+            executor.submit(_download_tile, url, tile_path, headers, timeout, session)
 
 def list_required_tiles(lat_range, lon_range, zoom_levels):
     """
@@ -254,6 +433,7 @@ def get_tile_zoom_levels(tile_dir="static/tiles"):
     return min(zooms), max(zooms) if zooms else (10, 17)
 
 
+@lru_cache(maxsize=1)
 def get_device_platform():
     """
     Returns a string identifier for the platform:
@@ -264,6 +444,8 @@ def get_device_platform():
     - 'windows'    Windows
     - 'darwin'     macOS
     - 'unknown'    Could not determine
+
+    The platform cannot change at runtime, so the result is cached.
     """
     # ARM embedded boards often have this file
     try:
@@ -1,30 +1,18 @@
 #i!/usr/bin/env python3
-import copy
-import requests
-import psutil
-import argh
 import toml
 import logging
 import os
-import time
-import glob
-import json
-import csv
 import sys
-import shutil
 import threading
-import subprocess
-from tabulate import tabulate
-from cmd import Cmd
-from datetime import datetime
-from pathlib import Path
-from typing import Optional, List, Dict, Any
+import marshal
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from .aggregator import Aggregator
 from .comm_interface import * #MQTTInterface, SerialInterface, GPIOInterface, Communicator, available_interfaces
 from .preprocessors import UnitConversion, AngleOffset, available_processors
 from .webapp import WebApp
-from .helpers import setup_logger, tipify, check_cdn_availability, download_cdn, check_internet_connectivity, download_tiles, list_required_tiles, get_device_platform, parse_uc_table
+from .helpers import HTTP, setup_logger, check_cdn_availability, download_cdn, precompress_static, check_internet_connectivity, download_tiles, list_required_tiles, get_device_platform, parse_uc_table
 from .track import Track
 from .database import Database
 
@@ -71,6 +59,8 @@ DEFAULT_CONFIG = {
     },
     "webapp": {
         "data_refresh": 2,
+        "server_threads": 8,
+        "connection_limit": 200,
         "timeout_offline": 60,
         "timeout_noncomm": 30,
         "rm_thesaurus": {
@@ -98,6 +88,77 @@ DEFAULT_CONFIG = {
 }
 
 
+_CONFIG_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                             "mothics", "config.marshal")
+"""Cache of the last parsed configuration file"""
+
+def _plain(obj):
+    """Convert `toml` dict/list subclasses (e.g. inline tables) to builtins."""
+    if isinstance(obj, dict):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_plain(v) for v in obj]
+    return obj
+
+def _load_toml_cached(path):
+    """
+    Parse a TOML file, reusing a marshal cache when the file is unchanged.
+
+    The cache is keyed on the absolute path and a hash of the contents
+    of `path` (modification times are too coarse on FAT SD cards to tell
+    quick same-size edits apart); any mismatch or cache error falls back
+    to parsing the TOML and rewriting the cache. Only the parsed file is
+    cached, so changes to `DEFAULT_CONFIG` never leave a stale
+    configuration.
+
+    Args:
+        path (str): Path of the TOML file.
+
+    Returns:
+        dict: Parsed file contents.
+
+    Raises:
+        FileNotFoundError: If `path` does not exist.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    key = (os.path.abspath(path), hashlib.blake2b(raw, digest_size=16).digest())
+    try:
+        with open(_CONFIG_CACHE, "rb") as f:
+            cached_key, data = marshal.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
+    data = _plain(toml.loads(raw.decode()))
+
+    # Best effort: marshal rejects e.g. TOML datetimes, just skip caching
+    try:
+        os.makedirs(os.path.dirname(_CONFIG_CACHE), exist_ok=True)
+        with open(_CONFIG_CACHE, "wb") as f:
+            marshal.dump((key, data), f)
+    except Exception:
+        pass
+    return data
+
+def _clone2(cfg):
+    """
+    Copy a configuration tree two levels deep.
+
+    Sections (and their dict/list values, e.g. `webapp.gps`) are
+    copied so the result can be mutated without touching
+    `DEFAULT_CONFIG`; leaves are immutable and shared.
+    """
+    def _copy(v):
+        if isinstance(v, dict):
+            return {k: (x.copy() if isinstance(x, (dict, list)) else x) for k, x in v.items()}
+        if isinstance(v, list):
+            return [x.copy() if isinstance(x, (dict, list)) else x for x in v]
+        return v
+    return {k: _copy(v) for k, v in cfg.items()}
+
+
 # System manager
 class SystemManager:
     def __init__(self, config_file="config.toml"):
@@ -108,7 +169,10 @@ class SystemManager:
         self.webapp = None
         self.track = None
         self.database = None
-        self.config = copy.deepcopy(DEFAULT_CONFIG)  # Always start with default settings as a failsafe
+        self._online = None  # Cached connectivity probe result
+        self._online_lock = threading.Lock()
+        self._executor = None  # Background pool for webapp asset downloads
+        self.config = _clone2(DEFAULT_CONFIG)  # Always start with default settings as a failsafe
 
         self.load_config()
         self.device_type = get_device_platform()
@@ -121,30 +185,32 @@ class SystemManager:
     def load_config(self):
         """Load TOML and overlay DEFAULT_CONFIG, but keep new sections intact."""
         cfg_file = {}
-        if os.path.exists(self.config_file):
-            try:
-                cfg_file = toml.load(self.config_file)
-            except Exception as e:
-                self._setup_logger(self.config["files"]["logger_fname"])
-                self.logger.warning(
-                    f"error loading {self.config_file}: {e}. Using defaults."
-                )
-        else:
+        try:
+            cfg_file = _load_toml_cached(self.config_file)
+        except FileNotFoundError:
             self._setup_logger(self.config["files"]["logger_fname"])
             self.logger.info(
                 f"no configuration file '{self.config_file}' found. Using defaults."
             )
+        except Exception as e:
+            self._setup_logger(self.config["files"]["logger_fname"])
+            self.logger.warning(
+                f"error loading {self.config_file}: {e}. Using defaults."
+            )
 
         # --- merge --------------------------------------------------------
         # 1) start with a *copy* of the defaults
-        self.config = {k: v.copy() if isinstance(v, dict) else v
-                       for k, v in DEFAULT_CONFIG.items()}
+        self.config = _clone2(DEFAULT_CONFIG)
 
         # 2) overlay everything that came from the file
         for section, data in cfg_file.items():
-            if (isinstance(data, dict)
-                    and isinstance(self.config.get(section), dict)):
-                self.config[section].update(data)   # deep-merge dicts
+            current = self.config.get(section)
+            if isinstance(data, dict) and isinstance(current, dict):
+                for k, v in data.items():
+                    if isinstance(v, dict) and isinstance(current.get(k), dict):
+                        current[k].update(v)        # keep default subkeys
+                    else:
+                        current[k] = v
             else:
                 self.config[section] = data         # new or non-dict section
 
@@ -152,33 +218,17 @@ class SystemManager:
         self._setup_logger(self.config["files"]["logger_fname"])
         self.logger.info("configuration loaded (file + defaults)")
         
-    # def load_config(self):
-    #     """Loads the configuration file and merges it with defaults."""
-    #     config_from_file = {}
-        
-    #     if os.path.exists(self.config_file):
-    #         try:
-    #             config_from_file = toml.load(self.config_file)
-    #         except Exception as e:
-    #             # Initialize the logger even if config loading fails
-    #             self._setup_logger(self.config["files"]["logger_fname"])
-                
-    #             self.logger.warning(f"error loading configuration from {self.config_file}: {e}. Using defaults.")
-    #     else:
-    #         # If the config file doesn't exist, log a warning but keep using defaults
-    #         self._setup_logger(self.config["files"]["logger_fname"])
-            
-    #         self.logger.info(f"no configuration file '{self.config_file}' found. Using defaults.")
+    def _check_online(self):
+        """
+        Probe internet connectivity once and cache the result.
 
-    #     # Merge loaded config into defaults (config values overwrite defaults)
-    #     for section, defaults in DEFAULT_CONFIG.items():
-    #         self.config[section] = {**defaults, **config_from_file.get(section, {})}
+        The cache is cleared on `restart()`, so reconfigurations probe again.
+        """
+        with self._online_lock:
+            if self._online is None:
+                self._online = check_internet_connectivity(session=HTTP)
+            return self._online
 
-    #     # Set up the logger using the final merged config
-    #     logger_fname = self.config["files"]["logger_fname"]
-    #     self._setup_logger(logger_fname)
-    #     self.logger.info(f"configuration loaded successfully from {self.config_file if config_from_file else 'defaults'}.")
-        
     def initialize_cdns(self):
         """ Initializes CDNs for webapp display """
         # Get CDN URLs from configuration
@@ -197,19 +247,19 @@ class SystemManager:
             return
         
         # Check internet connectivity before downloading missing files
-        if not check_internet_connectivity():
+        if not self._check_online():
             self.logger.warning("Internet connectivity is not available. Cannot download missing CDNs.")
             self.logger.warning("Proceeding without updated CDN files")
             return
 
         # Download missing CDN files
         self.logger.info(f"Internet available. Downloading missing CDN files to {cdn_dir}")
-        download_cdn(urls=cdn_urls, outdir=cdn_dir)
+        download_cdn(urls=cdn_urls, outdir=cdn_dir, session=HTTP)
 
     def initialize_tiles(self):
         """Download map tiles for GPS map visualization."""
         # Check for internet availability
-        if not check_internet_connectivity():
+        if not self._check_online():
             self.logger.warning("Internet connectivity is not available. Cannot download map tiles.")
             return
         
@@ -223,11 +273,14 @@ class SystemManager:
         # Get map tiles to download based on lat/long range
         try:
             self.logger.info(f"downloading map tiles for lat={lat_range}, lon={lon_range}, zoom={zoom_levels}")
-            self.logger.info(f"number tiles to download: {len(list_required_tiles(lat_range, lon_range, zoom_levels))} in ~{len(list_required_tiles(lat_range, lon_range, zoom_levels)) * 0.25}s")
+            tiles = list_required_tiles(lat_range, lon_range, zoom_levels)
+            self.logger.info(f"number tiles to download: {len(tiles)} in ~{len(tiles) * 0.25}s")
             download_tiles(lat_range=tuple(lat_range),
                            lon_range=tuple(lon_range),
                            zoom_levels=zoom_levels,
-                           output_dir=output_dir)
+                           output_dir=output_dir,
+                           tiles=tiles,
+                           session=HTTP)
             self.logger.info(f"tile download completed and stored in {output_dir}")
         except Exception as e:
             self.logger.warning(f"error while downloading map tiles: {e}")
@@ -252,11 +305,12 @@ class SystemManager:
                 self.logger.critical(f"error in database initialization, got {e}" )
 
         # Initialize track
+        track_cfg = self.config["track"]
         self.track = Track(mode=mode,
-                           checkpoint_interval=self.config["track"]["checkpoint_interval"],
-                           max_checkpoint_files=self.config["track"]["max_checkpoint_files"],
-                           trim_fraction=self.config["track"]["trim_fraction"],
-                           max_datapoints=self.config["track"]["max_datapoints"],
+                           checkpoint_interval=track_cfg["checkpoint_interval"],
+                           max_checkpoint_files=track_cfg["max_checkpoint_files"],
+                           trim_fraction=track_cfg["trim_fraction"],
+                           max_datapoints=track_cfg["max_datapoints"],
                            output_dir=self.config["files"]["output_dir"])
         # Load from file if specified
         if mode == "replay" and track_file:
@@ -277,10 +331,11 @@ class SystemManager:
     def initialize_webapp(self):
         """ Initializes the web application with necessary getters and setters. """
         if not self.webapp:
-            # Initialize CDNs
-            self.initialize_cdns()
-            # Initialize tiles
-            self.initialize_tiles()
+            # Download CDNs and tiles in the background while the webapp is built
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="WebappInit")
+            downloads = [self._executor.submit(self.initialize_cdns),
+                         self._executor.submit(self.initialize_tiles)]
             
             # Pass all getter functions
             getters = {
@@ -296,83 +351,92 @@ class SystemManager:
             }
 
             # Initialize Webapp
+            webapp_cfg = self.config["webapp"]
+            gps_cfg = webapp_cfg["gps"]
+            files_cfg = self.config["files"]
             self.webapp = WebApp(
                 getters=getters,
                 setters=setters,
-                auto_refresh_table=self.config["webapp"]["data_refresh"],
-                logger_fname=self.config["files"]["logger_fname"],
-                rm_thesaurus=self.config["webapp"]["rm_thesaurus"],
-                data_thesaurus=self.config["webapp"]["data_thesaurus"],
-                hidden_data_cards=self.config["webapp"]["hidden_data_cards"],
-                hidden_data_plots=self.config["webapp"]["hidden_data_plots"],
-                timeout_offline=self.config["webapp"]["timeout_offline"],
-                timeout_noncomm=self.config["webapp"]["timeout_noncomm"],
+                auto_refresh_table=webapp_cfg["data_refresh"],
+                logger_fname=files_cfg["logger_fname"],
+                rm_thesaurus=webapp_cfg["rm_thesaurus"],
+                data_thesaurus=webapp_cfg["data_thesaurus"],
+                hidden_data_cards=webapp_cfg["hidden_data_cards"],
+                hidden_data_plots=webapp_cfg["hidden_data_plots"],
+                timeout_offline=webapp_cfg["timeout_offline"],
+                timeout_noncomm=webapp_cfg["timeout_noncomm"],
                 track_manager=self.database,
-                track_manager_directory=self.config["files"]["output_dir"],
-                gps_tiles_directory=self.config["files"]["tile_dir"],
-                track_variable=self.config["webapp"]["gps"]["track_variable"],
-                track_thresholds=self.config["webapp"]["gps"]["track_thresholds"],
-                track_colors=self.config["webapp"]["gps"]["track_colors"],
-                track_units=self.config["webapp"]["gps"]["track_units"],
-                track_history_minutes=self.config["webapp"]["gps"]["track_history"],
+                track_manager_directory=files_cfg["output_dir"],
+                gps_tiles_directory=files_cfg["tile_dir"],
+                track_variable=gps_cfg["track_variable"],
+                track_thresholds=gps_cfg["track_thresholds"],
+                track_colors=gps_cfg["track_colors"],
+                track_units=gps_cfg["track_units"],
+                track_history_minutes=gps_cfg["track_history"],
                 instance_dir=os.path.dirname(sys.modules['__main__'].__file__),
-                out_dir=self.config["files"]["output_dir"],
+                out_dir=files_cfg["output_dir"],
                 system_manager=self
             )
+            # Serve only once the static assets are in place
+            wait(downloads)
+            for future in downloads:
+                if future.exception() is not None:
+                    self.logger.warning(f"error while initializing webapp assets: {future.exception()}")
+
             # self.webapp.run()
-            t = threading.Thread(target=self.webapp.serve, daemon=True, name="WaitressServer")
+            t = threading.Thread(target=self.webapp.serve, daemon=True, name="WaitressServer",
+                                 kwargs={"threads": webapp_cfg["server_threads"],
+                                         "connection_limit": webapp_cfg["connection_limit"]})
             t.start()
 
+            # Precompress static assets in the background; until done,
+            # Flask-Compress compresses them on the fly
+            self._executor.submit(self._precompress_static, self.webapp.app.static_folder)
+
+    def _precompress_static(self, static_dir):
+        """ Writes compressed copies of the webapp static assets """
+        try:
+            precompress_static(static_dir)
+            self.logger.info(f"static assets precompressed in {static_dir}")
+        except Exception as e:
+            self.logger.warning(f"error while precompressing static assets: {e}")
+
     def start_live(self):
         self.initialize_common_components("live")
 
-        # Initialize interfaces
+        # Initialize interfaces and preprocessors in a single pass
         interfaces = {}
+        preprocessors = {}
 
         for section_name, section_cfg in self.config.items():
             iface_cls = available_interfaces.get(section_name)
-            # Ignore unknown/unavailable interfaces
-            if iface_cls is None:
-                continue
-            
-            # Skip GPIO on non-Raspberry Pi targets
-            if iface_cls is GPIOInterface and self.device_type != "rpi":
+            proc_cls = available_processors.get(section_name)
+            # Ignore unknown/unavailable sections
+            if iface_cls is None and proc_cls is None:
                 continue
-            
+
             # Distinguish “one interface” vs “many sub-interfaces”
-            if isinstance(section_cfg, dict) and section_cfg and all(
-                    isinstance(v, dict) for v in section_cfg.values()
-            ):
-                # Many sub-interfaces (serial, gpio, …)
-                interfaces[iface_cls] = list(section_cfg.values())
-            else:
-                # Single interface (mqtt, …)
-                interfaces[iface_cls] = section_cfg
+            is_multi = isinstance(section_cfg, dict) and section_cfg and all(
+                isinstance(v, dict) for v in section_cfg.values()
+            )
 
-        # Initialize preprocessors
-        preprocessors = {}
-        
-        for section_name, section_cfg in self.config.items():
-            proc_cls = available_processors.get(section_name)
-            if proc_cls is None:
-                continue
+            # Skip GPIO on non-Raspberry Pi targets
+            if iface_cls is not None and not (iface_cls is GPIOInterface and self.device_type != "rpi"):
+                if is_multi:
+                    # Many sub-interfaces (serial, gpio, …)
+                    interfaces[iface_cls] = list(section_cfg.values())
+                else:
+                    # Single interface (mqtt, …)
+                    interfaces[iface_cls] = section_cfg
 
             if proc_cls is UnitConversion:
                 # translate TOML to kwargs with our helper
                 kwargs = parse_uc_table(section_cfg)
-                
+
                 # allow more than one instance (rare, but keeps the API uniform)
                 preprocessors.setdefault(proc_cls, []).append(kwargs)
-                continue
-            
-            # Distinguish “one interface” vs “many sub-interfaces”.
-            if isinstance(section_cfg, dict) and section_cfg and all(
-                    isinstance(v, dict) for v in section_cfg.values()
-            ):
-                # Many sub-interfaces (serial, gpio, …)
-                preprocessors[proc_cls] = section_cfg # list(section_cfg.values())
-            else:
-                # Single interface (mqtt, …)
+            elif proc_cls is not None:
+                # Many sub-processors are passed as a dict, single ones as-is
                 preprocessors[proc_cls] = section_cfg
 
         # Initialize angle offsetter regardless
@@ -422,6 +486,11 @@ class SystemManager:
         if self.communicator:
             self.communicator.disconnect()
             self.communicator = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        # Release pooled HTTP connections; the session reconnects on demand
+        HTTP.close()
         self.logger.info("system stopped")
 
     def restart(self, mode=None, reload_config=False):
@@ -432,8 +501,10 @@ class SystemManager:
         
         if mode is None:
             mode = self.mode
+        self._online = None
+        # stop() joins the aggregator and interface threads, so no
+        # settling delay is needed before starting again
         self.stop()
-        time.sleep(1)
         if mode == "live":
             self.start_live()
         elif mode == "replay":
@@ -5,7 +5,7 @@ sensor data as `DataPoint` objects, contained and managed through a
 
 Classes
 -------
-- DataPoint:  A dataclass holding a timestamp and an associated data dictionary.
+- DataPoint:  A slotted dataclass holding a timestamp and an associated data dictionary.
 - Track:      Manages a list of `DataPoint` objects, provides replay functionality,
               and handles export operations.
 
@@ -15,6 +15,8 @@ Functions
 - export_to_csv:  Exports a list of `DataPoint` objects to a CSV file.
 - export_to_gpx:  Exports a list of `DataPoint` objects to a GPX file
                   for geospatial data visualization (e.g., on a map).
+- export_to_msgpack: Exports a list of `DataPoint` objects to a compact
+                  MessagePack stream (only if `msgpack` is installed).
 
 Notes
 -----
@@ -24,19 +26,42 @@ Notes
 - User defined export functions can be used, as long as they follow the `_export_base` structure.
 
 """
-import re
 import glob
 import os
 import csv
+import io
+import mmap
 import json
+import time
 import logging
 from tabulate import tabulate
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
 
-@dataclass
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+    """Keep `str(datetime)` timestamps, as read by `MetadataExtractor`"""
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_WRITE_BUFFER = 1 << 20
+"""Buffer size (bytes) of export files, well above the 4-8 KiB default"""
+
+_TABULATE_MAX_ROWS = 1000
+"""Above this many rows, `Track.__str__` formats its table without `tabulate`"""
+
+@dataclass(slots=True)
 class DataPoint:
     """
     Represents a single data measurement at a given point in time.
@@ -47,6 +72,8 @@ class DataPoint:
     """
     timestamp: datetime
     input_data: Dict[str, Any]
+    _iso: str = field(init=False, repr=False, compare=False)
+    """ISO 8601 string of `timestamp`, computed once for all exports"""
 
     def __post_init__(self):
         """
@@ -60,6 +87,12 @@ class DataPoint:
             raise ValueError("timestamp must be a datetime object")
         if not isinstance(self.input_data, dict):
             raise ValueError("data must be a dictionary")
+        self._iso = self.timestamp.isoformat()
+
+    @property
+    def iso_timestamp(self):
+        """ISO 8601 string of `timestamp`, formatted once at creation."""
+        return self._iso
         
     def to_dict(self):
         """
@@ -70,7 +103,7 @@ class DataPoint:
                   - "timestamp": A string of the timestamp in ISO format.
                   - All key-value pairs from `input_data`.
         """
-        return {"timestamp": self.timestamp.isoformat()} | self.input_data
+        return {"timestamp": self._iso} | self.input_data
 
     
 # Track export methods
@@ -93,6 +126,74 @@ def _export_base(data_points, filename, interval=None, field_names=None):
     """
     raise NotImplementedError("Base export function - not to be used directly")
 
+# Encode one record at a time (orjson handles dataclasses natively)
+if orjson is not None:
+    def _dumps_point(dp):
+        """Encode a data point as a JSON object (bytes)."""
+        return orjson.dumps(dp, default=str, option=_ORJSON_OPTIONS)
+else:
+    def _dumps_point(dp):
+        """Encode a data point as a JSON object (bytes)."""
+        return json.dumps({"timestamp": dp.timestamp, "input_data": dp.input_data},
+                          default=str).encode()
+
+_JSON_TAIL = b'\n]\n'
+"""Closing bytes of a JSON array written by `_write_json_array`"""
+
+def _write_json_records(data_points, out, sep=b',\n'):
+    """
+    Encode data points as JSON array items, one record per line.
+
+    Args:
+        data_points (Iterable[DataPoint]): The data points to encode.
+        out (BinaryIO): Writable binary stream (file or in-memory buffer).
+        sep (bytes, optional): Separator written before the first record.
+    """
+    for dp in data_points:
+        out.write(sep)
+        out.write(_dumps_point(dp))
+        sep = b',\n'
+
+def _write_json_array(data_points, out):
+    """
+    Encode data points as a JSON array, one record per line.
+
+    Args:
+        data_points (Iterable[DataPoint]): The data points to encode.
+        out (BinaryIO): Writable binary stream (file or in-memory buffer).
+    """
+    out.write(b'[')
+    _write_json_records(data_points, out, sep=b'\n')
+    out.write(_JSON_TAIL)
+
+def _recover_json_array(raw):
+    """
+    Parse the complete records of a JSON array whose tail was cut short.
+
+    Relies on the one-record-per-line layout of `_write_json_array`:
+    records are read line by line up to the first incomplete one.
+
+    Args:
+        raw (bytes): Contents of the truncated file.
+
+    Returns:
+        list or None: The complete records, or None if none can be read.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    lines = raw.split(b'\n')
+    if lines[0].strip() != b'[':
+        return None
+    records = []
+    for line in lines[1:]:
+        line = line.strip().rstrip(b',')
+        if line == b']':
+            break
+        try:
+            records.append(loads(line))
+        except ValueError:
+            break
+    return records or None
+
 def export_to_json(data_points, filename, interval=None, field_names=None):
     """
     Export a list of DataPoint objects to a JSON file.
@@ -116,8 +217,9 @@ def export_to_json(data_points, filename, interval=None, field_names=None):
     if interval is not None:
         data_points_to_export = data_points[interval]
 
-    with open(filename, mode='w') as jsonfile:
-        json.dump([asdict(dp) for dp in data_points_to_export], jsonfile, default=str, indent=4)
+    # Stream the array to disk, one data point per line
+    with open(filename, mode='wb', buffering=_WRITE_BUFFER) as jsonfile:
+        _write_json_array(data_points_to_export, jsonfile)
 
 def export_to_csv(data_points, filename, interval=None, field_names=None):
     """
@@ -150,12 +252,28 @@ def export_to_csv(data_points, filename, interval=None, field_names=None):
         #       in DataPoint
         field_names = list(data_points_to_export[0].input_data.keys())
         
-    with open(filename, mode='w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=['timestamp'] + field_names)
-        writer.writeheader()
-        for point in data_points_to_export:
-            row = {'timestamp': point.timestamp.isoformat(), **point.input_data}
-            writer.writerow(row)
+    with open(filename, mode='w', newline='', buffering=_WRITE_BUFFER) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['timestamp'] + field_names)
+        # Positional rows: missing fields are left empty
+        writer.writerows([point._iso] + [point.input_data.get(f, '') for f in field_names]
+                         for point in data_points_to_export)
+
+_GPX_HEADER = (b'<gpx version="1.1" creator="TrackExporter">'
+               b'<metadata><name>Mothics Track export</name>'
+               b'<desc>Exported track data generated using Mothics</desc></metadata>'
+               b'<trk><trkseg>')
+_GPX_FOOTER = b'</trkseg></trk></gpx>'
+_GPX_TRKPT = '<trkpt lat=%s lon=%s>%s<time>%s</time></trkpt>'
+_GPX_ELE = '<ele>%s</ele>'
+
+def _xml_attr(value):
+    """Quote a value for use as an XML attribute."""
+    return quoteattr(str(value))
+
+def _xml_text(value):
+    """Escape a value for use as XML character data."""
+    return escape(str(value))
 
 def export_to_gpx(data_points, filename, interval=None):
     """
@@ -181,49 +299,96 @@ def export_to_gpx(data_points, filename, interval=None):
     if interval is not None:
         data_points_to_export = data_points[interval]
 
-    # Create the root GPX element
-    gpx = ET.Element("gpx", version="1.1", creator="TrackExporter")
-    
-    # Metadata (creator, time, etc.)
-    metadata = ET.SubElement(gpx, "metadata")
-    name = ET.SubElement(metadata, "name")
-    name.text = "Mothics Track export"
-    desc = ET.SubElement(metadata, "desc")
-    desc.text = "Exported track data generated using Mothics"
-    
-    # Add a track (trk)
-    trk = ET.SubElement(gpx, "trk")
-    trkseg = ET.SubElement(trk, "trkseg")  # Track segment
-
-    for dp in data_points_to_export:
-        # Get lat, lon keys
-        lat_key = next((key for key in dp.input_data if key.endswith('lat')), None)
-        lon_key = next((key for key in dp.input_data if key.endswith('lon') or key.endswith('long')), None)
-        
-        lat = dp.input_data.get(lat_key)
-        lon = dp.input_data.get(lon_key)
+    # GPX is written directly, without building an element tree
+    with open(filename, mode='wb', buffering=_WRITE_BUFFER) as gpxfile:
+        # Root element and metadata (creator, description, ...)
+        gpxfile.write(_GPX_HEADER)
 
-        if lat is None or lon is None:
-            continue
-        
-        trkpt = ET.SubElement(trkseg, "trkpt", lat=str(lat), lon=str(lon))
+        fields = None
+        for dp in data_points_to_export:
+            data = dp.input_data
+            # Get lat, lon (and elevation) keys; rescan only if the field set changes
+            if data.keys() != fields:
+                fields = frozenset(data)
+                lat_key = next((key for key in data if key.endswith('lat')), None)
+                lon_key = next((key for key in data if key.endswith('lon') or key.endswith('long')), None)
+                alt_key = next((key for key in data if key.endswith(('alt', 'elev', 'altitude'))), None)
+
+            lat = data.get(lat_key)
+            lon = data.get(lon_key)
+
+            if lat is None or lon is None:
+                continue
 
-        # Optional: Add elevation if available
-        alt_key = next((key for key in dp.input_data if key.endswith(('alt', 'elev', 'altitude'))), None)
-        alt = dp.input_data.get(alt_key)
-        if alt is not None:
-            ele = ET.SubElement(trkpt, "ele")
-            ele.text = str(alt)
+            # Optional: Add elevation if available
+            alt = data.get(alt_key)
+            ele = _GPX_ELE % _xml_text(alt) if alt is not None else ''
 
-        # Timestamp
-        time = ET.SubElement(trkpt, "time")
-        time.text = dp.timestamp.isoformat()  # Timestamp in ISO 8601 format
+            # Timestamp in ISO 8601 format
+            trkpt = _GPX_TRKPT % (_xml_attr(lat), _xml_attr(lon), ele, dp._iso)
+            gpxfile.write(trkpt.encode('ascii', 'xmlcharrefreplace'))
+
+        gpxfile.write(_GPX_FOOTER)
+
+def export_to_msgpack(data_points, filename, interval=None, field_names=None):
+    """
+    Export a list of DataPoint objects to a MessagePack file.
+
+    The file is a stream of maps with the same `timestamp` and
+    `input_data` keys as the JSON export, one per data point; read it
+    back with `msgpack.Unpacker`.
+
+    Args:
+        data_points (list[DataPoint]): The data points to export.
+        filename (str): Path to the MessagePack file.
+        interval (slice, optional): If provided, only data points in this slice
+            are exported. Defaults to exporting the entire list.
+        field_names (list[str], optional): Not currently used by this function,
+            but maintained for API compatibility.
+
+    Raises:
+        RuntimeError: If `data_points` is None or `msgpack` is not installed.
+    """
+    if data_points is None:
+        raise RuntimeError("no data points to save.")
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed.")
+
+    # Slice data_point list
+    data_points_to_export = data_points
+    if interval is not None:
+        data_points_to_export = data_points[interval]
 
-    # Write the GPX file
-    tree = ET.ElementTree(gpx)
-    tree.write(filename)
+    packer = msgpack.Packer(default=str)
+    with open(filename, mode='wb', buffering=_WRITE_BUFFER) as packfile:
+        for dp in data_points_to_export:
+            packfile.write(packer.pack({"timestamp": str(dp.timestamp), "input_data": dp.input_data}))
 
 _export_methods = {'json': export_to_json, 'csv': export_to_csv, 'gpx': export_to_gpx}
+if msgpack is not None:
+    _export_methods['msgpack'] = export_to_msgpack
+
+
+def _github_table(headers, rows):
+    """
+    Format a github-style table like `tabulate(..., tablefmt="github")`.
+
+    Column widths are measured in one pass and every column is
+    left-aligned, which keeps long tables cheap to render.
+
+    Args:
+        headers (list[str]): Column headers.
+        rows (list[list]): Table rows, one value per header.
+
+    Returns:
+        str: The formatted table.
+    """
+    rows = [[str(v) for v in row] for row in rows]
+    widths = [max(len(h), max((len(row[i]) for row in rows), default=0))
+              for i, h in enumerate(headers)]
+    line = '| ' + ' | '.join(f'{{:<{w}}}' for w in widths) + ' |'
+    rule = '|' + '|'.join('-' * (w + 2) for w in widths) + '|'
+    return '\n'.join([line.format(*headers), rule] + [line.format(*row) for row in rows])
 
 
 # Track
@@ -298,7 +463,26 @@ class Track:
         # Internal attributes not exposed as parameters
         self._replay_index = 0
         self._last_checkpoint = None
+        """`time.monotonic()` of the last checkpoint"""
         self._save_interval_start = None
+        self._checkpoint_file = None
+        """Checkpoint file of the current run, extended in place"""
+        self._checkpoint_index = None
+        """Index of the first data point not yet in `_checkpoint_file`"""
+        self._enc_buf = None
+        """Encoding buffer reused across checkpoint writes"""
+        self._checkpoint_writer = None
+        """Single background writer, so queued checkpoints hit disk in order"""
+        self._checkpoint_files = None
+        """Rotated checkpoint files on disk, oldest first (see `_rotated_checkpoints`)"""
+        self._checkpoint_future = None
+        """Most recently queued checkpoint write"""
+        self._failed_checkpoint = None
+        """Checkpoint file whose last write failed; only used by `_checkpoint_writer`"""
+        self._latest = {}
+        """Most recent data point for each field"""
+        self._field_set = (None, 0, frozenset())
+        """`field_names` as last seen by `_expected_fields`, with its length and set"""
         
         # Setup directories for output and checkpoints
         self.checkpoint_dir = os.path.join(self.output_dir, 'chk')
@@ -316,7 +500,9 @@ class Track:
         Return a tabular view (string) of all data points.
 
         Uses the `tabulate` library to display a table with columns 
-        for 'timestamp' and each field in `field_names`.
+        for 'timestamp' and each field in `field_names`. Long tracks are
+        formatted by `_github_table` instead, which produces the same
+        layout in a single pass, with all columns left-aligned.
 
         Returns:
             str: A formatted table. If there are no data points, returns a string 
@@ -325,14 +511,18 @@ class Track:
         if not self.data_points:
             return "No data points available."
         
-        # Set available field names if None are provided 
-        if self.field_names is None:
-            self.field_names = list(self.data_points[-1].to_dict().keys())
+        # Use available field names if None are provided
+        # NOTE: not stored, since `add_point` validates against `field_names`
+        field_names = self.field_names
+        if field_names is None:
+            field_names = list(self.data_points[-1].input_data.keys())
         
         # Prepare headers and rows for the table
-        headers = ["Timestamp"] + self.field_names
-        rows = [[dp.timestamp.isoformat()] + [dp.input_data.get(field, "") for field in self.field_names] for dp in self.data_points]
+        headers = ["Timestamp"] + field_names
+        rows = [[dp._iso] + [dp.input_data.get(field, "") for field in field_names] for dp in self.data_points]
 
+        if len(rows) > _TABULATE_MAX_ROWS:
+            return _github_table(headers, rows)
         return tabulate(rows, headers=headers, tablefmt="github")
 
     def load(self, filename: str):
@@ -340,7 +530,9 @@ class Track:
         Load a Track from a JSON file.
 
         The JSON is expected to be a list of serialized `DataPoint` objects. 
-        After loading, the Track is placed in 'replay' mode.
+        After loading, the Track is placed in 'replay' mode. A file whose
+        tail was cut short (e.g. by a crash while it was written) is
+        loaded up to its last complete record.
 
         Args:
             filename (str): Path to the JSON file containing the Track data.
@@ -348,14 +540,28 @@ class Track:
         Raises:
             RuntimeError: If the file cannot be parsed as JSON.
         """
-        with open(filename, 'r') as f:
+        with open(filename, 'rb') as f:
             try:
-                data = json.load(f)
+                if orjson is not None:
+                    # Parse straight from the page cache, without a read() copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        data = orjson.loads(view)
+                else:
+                    data = json.load(f)
+            except ValueError:
+                # Salvage the complete records of a truncated array
+                f.seek(0)
+                data = _recover_json_array(f.read())
+                if data is None:
+                    self.logger.critical(f'could not load {filename} into a Track')
+                    raise RuntimeError(f'could not load {filename} into a Track')
+                self.logger.warning(f'{filename} is truncated; loaded its first {len(data)} records')
             except:
                 self.logger.critical(f'could not load {filename} into a Track')
                 raise RuntimeError(f'could not load {filename} into a Track')
 
         self.data_points = [DataPoint(datetime.fromisoformat(dp["timestamp"]), dp["input_data"]) for dp in data]
+        self._latest = {}
         self.mode = 'replay'
         
     def save(self, file_format='json', fname=None, output_dir=None, interval=None):
@@ -398,9 +604,7 @@ class Track:
             export(self.data_points, file_path, interval=interval)
             self.logger.info(f"saving track to {file_format}: {file_path}")
         except Exception as e:
-            import traceback
-            self.logger.critical(f'error in saving track: {e}')
-            print(traceback.format_exc())
+            self.logger.critical(f'error in saving track: {e} \n {format_exc()}')
     
     def _remove_datapoints(self, start=0, fraction=0.1):
         """
@@ -425,8 +629,16 @@ class Track:
         start = max(0, min(start, len(self.data_points) - 1))
         end = min(start + num_to_remove, len(self.data_points))
 
-        # Remove the specified range
-        del self.data_points[start:end]
+        # Remove the specified range; rebinding (instead of an in-place
+        # `del`) copies only the kept points and leaves readers in other
+        # threads iterating over a consistent list
+        self.data_points = self.data_points[:start] + self.data_points[end:]
+        # Keep run/checkpoint indices pointing at the same data points
+        removed = end - start
+        if self._save_interval_start is not None and self._save_interval_start >= start:
+            self._save_interval_start = max(start, self._save_interval_start - removed)
+        if self._checkpoint_index is not None and self._checkpoint_index >= start:
+            self._checkpoint_index = max(start, self._checkpoint_index - removed)
         self.logger.info(f"cleared {num_to_remove} data points from index {start} to {end-1}; remaining: {len(self.data_points)}")
                 
     def start_run(self):
@@ -461,13 +673,16 @@ class Track:
             interval = slice(self._save_interval_start, len(self.data_points) - 1)
             self.save(interval=interval)
             # Cleanup checkpoint storage (except -full files)
-            chk_files_all= glob.glob(os.path.join(self.checkpoint_dir, "*.chk.json"))
-            chk_files = [f for f in chk_files_all if not re.search(r"-full\.chk\.json$", f)]
-            for f in chk_files:
-                os.remove(f)
+            self._wait_checkpoints()
+            checkpoint_files = self._rotated_checkpoints()
+            while checkpoint_files:
+                self._remove_checkpoint(checkpoint_files.popleft())
             # Clean up interval indices and reset mode
             self._save_interval_start = None
             self._last_checkpoint = None
+            self._checkpoint_file = None
+            self._checkpoint_index = None
+            self._checkpoint_future = None
             self.save_mode = 'on-demand'
             self.logger.info('data logging ended')
         else:
@@ -484,25 +699,182 @@ class Track:
                 for identification (e.g., '-full').
         """
         if self.save_mode == 'continuous' and self.checkpoint_interval is not None:
-            now = datetime.now()
+            # Compare monotonic seconds; the wall clock is only read to name files
+            mono = time.monotonic()
             # Save a checkpoint if above time threshold (or no points are available)
-            if self._last_checkpoint is None or (now - self._last_checkpoint).total_seconds() > self.checkpoint_interval or force:
-                self._last_checkpoint = now
-                interval = slice(self._save_interval_start, len(self.data_points) - 1)
-                fname=f'{now.strftime("%Y%m%d-%H%M%S")}.chk'
+            if self._last_checkpoint is None or mono - self._last_checkpoint > self.checkpoint_interval or force:
+                self._last_checkpoint = mono
+                now = datetime.now()
                 if specifier is not None:
+                    # Standalone snapshot of the whole run
+                    interval = slice(self._save_interval_start, len(self.data_points) - 1)
                     fname=f'{now.strftime("%Y%m%d-%H%M%S")+str(specifier)}.chk'
-                self.save(interval=interval, fname=fname, output_dir=self.checkpoint_dir)
+                    self._write_checkpoint(os.path.join(self.checkpoint_dir, fname + '.json'),
+                                           self.data_points[interval])
+                else:
+                    self._extend_checkpoint(now)
+
+    def _rotated_checkpoints(self):
+        """
+        Rotated checkpoint files on disk, oldest first.
 
-            # Remove older files from checkpoint directory
-            chk_files_all= glob.glob(os.path.join(self.checkpoint_dir, "*.chk.json"))
-            # Remove all checkpoints with the `-full` specifier
-            chk_files = [f for f in chk_files_all if not re.search(r"-full\.chk\.json$", f)]
+        Files left by previous sessions (except -full files) are looked
+        up on first use, so tracks that never checkpoint (replay,
+        exports) skip the directory scan.
+
+        Returns:
+            collections.deque[str]: Paths of the checkpoint files.
+        """
+        if self._checkpoint_files is None:
+            chk_files_all = glob.glob(os.path.join(self.checkpoint_dir, "*.chk.json"))
+            chk_files = [f for f in chk_files_all if not f.endswith("-full.chk.json")]
             chk_files.sort(key=os.path.getmtime)
-            
-            if len(chk_files) > self.max_checkpoint_files:
-                # Delete the oldest file
-                os.remove(chk_files[0])
+            self._checkpoint_files = deque(chk_files)
+        return self._checkpoint_files
+
+    def _remove_checkpoint(self, file_path):
+        """Delete a checkpoint file, ignoring files already gone."""
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def _extend_checkpoint(self, now):
+        """
+        Add the data points collected since the last checkpoint to the
+        checkpoint file of the current run.
+
+        The first checkpoint of a run creates a new file; later ones
+        only append the new records, so each checkpoint costs time
+        proportional to the new data rather than to the whole run.
+
+        Args:
+            now (datetime): Checkpoint time, used to name a new file.
+        """
+        if self._checkpoint_index is None:
+            self._checkpoint_index = self._save_interval_start or 0
+        new_points = self.data_points[self._checkpoint_index:]
+        if not new_points:
+            return
+
+        # A failed write (reported by the writer) restarts the run in a
+        # new file, so a missing or broken file is replaced by a full rewrite
+        future = self._checkpoint_future
+        if future is not None and future.done() and not future.result():
+            self._checkpoint_file = None
+        append = self._checkpoint_file is not None
+        if not append:
+            # Start a new file holding the whole run so far
+            fname = f'{now.strftime("%Y%m%d-%H%M%S")}.chk.json'
+            self._checkpoint_file = os.path.join(self.checkpoint_dir, fname)
+            new_points = self.data_points[self._save_interval_start or 0:]
+
+        if self._write_checkpoint(self._checkpoint_file, new_points, append=append):
+            self._checkpoint_index = len(self.data_points)
+
+        # Track new files and delete the oldest ones beyond the limit
+        if not append:
+            checkpoint_files = self._rotated_checkpoints()
+            if self._checkpoint_file in checkpoint_files:
+                checkpoint_files.remove(self._checkpoint_file)
+            checkpoint_files.append(self._checkpoint_file)
+            while len(checkpoint_files) > self.max_checkpoint_files:
+                self._remove_checkpoint(checkpoint_files.popleft())
+
+    def _write_checkpoint(self, file_path, data_points, append=False):
+        """
+        Encode a JSON checkpoint and queue it for writing.
+
+        Data points are encoded on the calling thread into the reusable
+        `_enc_buf` buffer, so the checkpoint matches the track at call
+        time; the disk write itself runs on `_checkpoint_writer` and does
+        not hold up sampling. Both are created with the first checkpoint.
+
+        Args:
+            file_path (str): Path of the checkpoint file.
+            data_points (list[DataPoint]): The data points to store.
+            append (bool, optional): If True, `data_points` are inserted
+                before the closing bracket of the existing JSON array in
+                `file_path`, instead of overwriting it. Defaults to False.
+
+        Returns:
+            bool: True if the checkpoint was encoded and queued.
+        """
+        if self._checkpoint_writer is None:
+            self._enc_buf = io.BytesIO()
+            self._checkpoint_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Track checkpoint')
+        buf = self._enc_buf
+        buf.seek(0)
+        buf.truncate()
+        try:
+            if append:
+                _write_json_records(data_points, buf)
+                buf.write(_JSON_TAIL)
+            else:
+                _write_json_array(data_points, buf)
+        except Exception as e:
+            self.logger.critical(f'error in encoding checkpoint: {e}')
+            return False
+        self._checkpoint_future = self._checkpoint_writer.submit(self._flush_checkpoint, file_path,
+                                                                 buf.getvalue(), append)
+        return True
+
+    def _flush_checkpoint(self, file_path, payload, append):
+        """
+        Write an encoded checkpoint to disk; runs on `_checkpoint_writer`.
+
+        New files are built in a temporary sibling, synced and renamed
+        into place. Appends only write the new records over the closing
+        bracket of `file_path` and sync it: a crash mid-append leaves an
+        array with a truncated tail, which `Track.load` recovers up to
+        its last complete record.
+
+        Args:
+            file_path (str): Path of the checkpoint file.
+            payload (bytes): Encoded checkpoint, from `_write_checkpoint`.
+            append (bool): If True, overwrite the closing bracket of the
+                existing file with `payload`.
+
+        Returns:
+            bool: True if the checkpoint was written. Appends queued after
+            a failed write to the same file are skipped (and return False),
+            so no later records land past the missing ones.
+        """
+        tmp_path = None
+        try:
+            if append and file_path is not None and file_path == self._failed_checkpoint:
+                return False
+            tmp_path = file_path + '.tmp'
+            if append:
+                fd = os.open(file_path, os.O_WRONLY)
+                os.lseek(fd, -len(_JSON_TAIL), os.SEEK_END)
+            else:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if not append:
+                os.replace(tmp_path, file_path)
+            self.logger.info(f"saving checkpoint: {file_path}")
+        except Exception as e:
+            self.logger.critical(f'error in saving checkpoint: {e}')
+            self._failed_checkpoint = file_path
+            if not append and tmp_path is not None:
+                self._remove_checkpoint(tmp_path)
+            return False
+        if file_path == self._failed_checkpoint:
+            self._failed_checkpoint = None
+        return True
+
+    def _wait_checkpoints(self):
+        """Block until every queued checkpoint has been written."""
+        if self._checkpoint_future is not None:
+            self._checkpoint_future.result()
 
     def add_point(self, timestamp: datetime, data: Dict[str, Any]):
         """
@@ -524,7 +896,7 @@ class Track:
         """
         # Validate or establish field consistency
         # NOTE: if no field names are passed, no checks are performed
-        if self.field_names is not None and set(self.field_names) != set(data.keys()):
+        if self.field_names is not None and data.keys() != self._expected_fields():
             raise ValueError(f"inconsistent fields. Expected {self.field_names}, got {list(data.keys())}")
 
         # Handle track longer than maximum number of datapoints
@@ -534,6 +906,8 @@ class Track:
             # Fraction of points to trim
             fraction = (len(self.data_points)-1)/len(self.data_points)
             self._remove_datapoints(fraction=fraction)
+            # Following checkpoints go to a new file, without overlaps
+            self._checkpoint_file = None
 
         # Pre-process data before generating the datapoint
         datapoint = DataPoint(timestamp, data)
@@ -542,9 +916,24 @@ class Track:
        
         # Append the datapoint
         self.data_points.append(datapoint)
+        for key in datapoint.input_data:
+            self._latest[key] = datapoint
         # Run checkpointing
         self._save_checkpoint()
 
+    def _expected_fields(self):
+        """
+        Set of `field_names`, rebuilt only when the list is replaced or resized.
+
+        Returns:
+            frozenset[str]: The expected keys of each data point.
+        """
+        names, size, fields = self._field_set
+        if names is not self.field_names or size != len(self.field_names):
+            fields = frozenset(self.field_names)
+            self._field_set = (self.field_names, len(self.field_names), fields)
+        return fields
+
     def get_latest_data(self):
         """
         Retrieve the most recent data point for each unique field.
@@ -557,12 +946,19 @@ class Track:
         if not self.data_points:
             return []
 
-        latest_data = {}
-        for dp in self.data_points:
-            for field, value in dp.data.items():
-                latest_data[field] = dp  # Overwrite to get the most recent
-
-        return list(latest_data.values())
+        # Rebuild if data points were set without `add_point` (e.g. load, replay),
+        # scanning backwards so each field is set once, by its newest point
+        if not self._latest:
+            wanted = len(self.field_names) if self.field_names else None
+            for dp in reversed(self.data_points):
+                for field in dp.input_data:
+                    if field not in self._latest:
+                        self._latest[field] = dp
+                # With known fields, stop as soon as all of them are found
+                if wanted is not None and len(self._latest) >= wanted:
+                    break
+
+        return list(self._latest.values())
 
     def get_current(self):
         """
@@ -1,14 +1,10 @@
 import secrets
-import socket
 import os
-import requests
-import time
+import mimetypes
 import logging
-from flask import Flask
+from flask import Flask, request, send_from_directory
 from threading import Thread
 from flask_compress import Compress
-from tornado.log import access_log, app_log, gen_log
-from waitress import serve
 
 from .blueprints.bp_monitoring import monitor_bp
 from .blueprints.bp_logging import log_bp
@@ -16,6 +12,8 @@ from .blueprints.bp_saving import save_bp
 from .blueprints.bp_settings import settings_bp
 from .blueprints.bp_database import database_bp
 
+_LOGGING_CONFIGURED = False
+"""Set once third-party loggers have been silenced"""
 
 class WebApp:
     def __init__(self, getters=None, setters=None, auto_refresh_table=2, logger_fname=None, rm_thesaurus=None, data_thesaurus=None, hidden_data_cards=None, hidden_data_plots=None, timeout_offline=60, timeout_noncomm=30, track_manager=None, track_manager_directory=None, plot_mode='real-time', gps_tiles_directory=None, track_variable='speed', track_thresholds=None, track_colors=None, track_units=None, out_dir=None, instance_dir=None, system_manager=None, track_history_minutes=None):
@@ -84,7 +82,6 @@ class WebApp:
             'LOGGER_FNAME': self.logger_fname,
             'TRACK_MANAGER_DIRECTORY': self.track_manager_directory,
             'TRACK_MANAGER': self.track_manager,
-            'LOGGER': self.logger,
             'GPS_TILES_DIRECTORY': self.gps_tiles_directory,
             'TRACK_VARIABLE': self.track_variable,
             'TRACK_THRESHOLDS': self.track_thresholds,
@@ -99,21 +96,34 @@ class WebApp:
             
         # Setup routes
         self.setup_routes()
+
+        # Serve precompressed static assets
+        self.setup_static()
         
     def setup_logging(self):
+        global _LOGGING_CONFIGURED
+
+        # Create the main logger
+        self.logger = logging.getLogger("WebApp")
+
+        # Configure third-party loggers only once per process; every
+        # setLevel call also flushes the level cache of all loggers
+        if _LOGGING_CONFIGURED:
+            return
+        _LOGGING_CONFIGURED = True
+
         # Silence Waitress
         logging.getLogger("waitress").setLevel(logging.ERROR)
         
-        # Silence Tornado
-        for tlog in [access_log, app_log, gen_log]:
+        # Silence Tornado (by logger name, no need to import it)
+        for name in ["tornado.access", "tornado.application", "tornado.general"]:
+            tlog = logging.getLogger(name)
             tlog.setLevel(logging.ERROR)
             tlog.propagate = False
 
         # Silence werkzeug
         logging.getLogger("werkzeug").setLevel(logging.ERROR)
 
-        # Create the main logger
-        self.logger = logging.getLogger("WebApp")
         self.logger.setLevel(logging.DEBUG)
 
     def setup_secret_key(self):
@@ -127,27 +137,38 @@ class WebApp:
         """
         # Get path
         instance_path = os.path.join(self.out_dir, 'instance')
-        os.makedirs(instance_path, exist_ok=True)
         secret_key_path = os.path.join(instance_path, 'secret_key')
 
         # Try environment variable first
         secret_key = os.environ.get('FLASK_SECRET_KEY')
 
-        # If no environment variable, try reading from file
-        if not secret_key and os.path.exists(secret_key_path):
-            with open(secret_key_path, 'r') as f:
-                secret_key = f.read().strip()
+        # If no environment variable, try reading from file (bytes are fine for Flask)
+        if not secret_key:
+            try:
+                fd = os.open(secret_key_path, os.O_RDONLY)
+                try:
+                    secret_key = os.read(fd, 128)
+                finally:
+                    os.close(fd)
+            except FileNotFoundError:
+                pass
+            # Raw 32-byte keys are used as-is; older hex keys are still
+            # valid keys, only surrounding whitespace is dropped
+            if secret_key and len(secret_key) != 32:
+                secret_key = secret_key.strip()
 
         # If no existing key, generate a new one
         if not secret_key:
-            secret_key = secrets.token_hex(32)  # 256-bit key
-            
-            # Save generated key to file for persistence
-            with open(secret_key_path, 'w') as f:
-                f.write(secret_key)
+            secret_key = secrets.token_bytes(32)  # 256-bit key
             
-            # Secure the file
-            os.chmod(secret_key_path, 0o600)  # Read/write for owner only
+            # Save generated key to file for persistence, read/write for owner only
+            os.makedirs(instance_path, exist_ok=True)
+            fd = os.open(secret_key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.fchmod(fd, 0o600)  # in case an empty file already existed
+                os.write(fd, secret_key)
+            finally:
+                os.close(fd)
 
         # Configure the app with the secret key
         self.app.secret_key = secret_key
@@ -167,6 +188,30 @@ class WebApp:
         self.app.register_blueprint(save_bp)
         self.app.register_blueprint(database_bp)
 
+    def setup_static(self):
+        """
+        Serve precompressed static assets when available.
+
+        If the client accepts it, `<file>.br` or `<file>.gz` (written by
+        `helpers.precompress_static`) is sent in place of `<file>`, so
+        Flask-Compress does not compress the same asset on every request.
+        """
+        static_folder = self.app.static_folder
+        serve_static = self.app.view_functions['static']
+
+        def static(filename):
+            accept = request.accept_encodings
+            for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+                if accept[encoding] and os.path.isfile(os.path.join(static_folder, filename + suffix)):
+                    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                    response = send_from_directory(static_folder, filename + suffix, mimetype=mimetype)
+                    response.headers['Content-Encoding'] = encoding
+                    response.vary.add('Accept-Encoding')
+                    return response
+            return serve_static(filename=filename)
+
+        self.app.view_functions['static'] = static
+
     def run_developement(self, host="0.0.0.0", port=5000, debug=False):
         """
         Start the integrated Werkzeug server for developement.
@@ -175,5 +220,18 @@ class WebApp:
         self.process.daemon = True
         self.process.start()
         
-    def serve(self, host="0.0.0.0", port=5000):
-        serve(self.app, host=host, port=port)
+    def serve(self, host="0.0.0.0", port=5000, threads=8, connection_limit=200, channel_timeout=120):
+        """
+        Serve the app through Waitress.
+
+        The worker pool is sized for the periodic dashboard polls;
+        `poll()` is used instead of `select()` to lift the 1024 fd limit.
+        """
+        # Imported here: the development server does not need Waitress
+        from waitress import serve
+
+        serve(self.app, host=host, port=port,
+              threads=threads,
+              connection_limit=connection_limit,
+              channel_timeout=channel_timeout,
+              asyncore_use_poll=True)
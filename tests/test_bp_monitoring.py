@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pytest
+
+bp_monitoring = pytest.importorskip("mothics.blueprints.bp_monitoring")
+track = pytest.importorskip("mothics.track")
+flask = pytest.importorskip("flask")
+
+
+def test_get_table_renders_once_per_tick(tmp_path, monkeypatch):
+    database = track.Track(output_dir=str(tmp_path), save_mode='on-demand')
+    now = datetime.now()
+    database.add_point(now, {"rm1/speed": 1.0, "rm1/sample_rate": 10, "rm1/last_timestamp": now})
+
+    app = flask.Flask(__name__)
+    app.config.update(GETTERS={'database': lambda: database},
+                      HIDDEN_DATA_CARDS=[],
+                      DATA_THESAURUS={})
+
+    renders = []
+    def render_template(name, **context):
+        renders.append(context)
+        return name
+    monkeypatch.setattr(bp_monitoring, "render_template", render_template)
+    monkeypatch.setattr(bp_monitoring, "_table_cache", (None, ''))
+
+    with app.app_context():
+        first = bp_monitoring.get_table()
+        second = bp_monitoring.get_table()
+        assert first == second
+        assert len(renders) == 1
+
+        # A new data point invalidates the cached table
+        database.add_point(datetime.now(), {"rm1/speed": 2.0, "rm1/sample_rate": 10, "rm1/last_timestamp": now})
+        bp_monitoring.get_table()
+        assert len(renders) == 2
+        assert renders[-1]["table_data"][0]["rm1/speed"] == {"value": 2.0, "sample_rate": 10}